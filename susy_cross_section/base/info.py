@@ -19,7 +19,21 @@ import itertools
 import json
 import logging
 import pathlib  # noqa: F401
-from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
+import sys
+import types
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy
 
 from susy_cross_section.utility import TypeCheck as TC
 
@@ -31,6 +45,13 @@ logger = logging.getLogger(__name__)
 
 UncSpecType = Tuple[List[str], str]
 
+# allowed json keys; frozensets to get unknown keys by one set-difference.
+_COLUMN_KEYS = frozenset(("index", "name", "unit"))
+_PARAMETER_KEYS = frozenset(("column", "granularity"))
+_FILE_KEYS = frozenset(
+    ("document", "columns", "parameters", "values", "reader_options", "attributes")
+)
+
 
 class ColumnInfo(object):
     """Stores information of a column.
@@ -62,10 +83,13 @@ class ColumnInfo(object):
     should be allowed to describe "x1000" etc.
     """
 
+    __slots__ = ("index", "name", "unit")
+
     def __init__(self, index, name, unit=""):
         # type: (int, str, str)->None
         self.index = index  # type: int
-        self.name = name  # type: str
+        # interned names share storage and make dict lookups pointer-compares.
+        self.name = sys.intern(name) if isinstance(name, str) else name  # type: str
         self.unit = unit or ""  # type: str
 
     @classmethod
@@ -88,21 +112,18 @@ class ColumnInfo(object):
         ValueError
             If :ar:`json_obj` has invalid data.
         """
-        try:
-            obj = cls(
-                index=json_obj["index"],
-                name=json_obj["name"],
-                unit=json_obj.get("unit", ""),
-            )
-        except (TypeError, AttributeError) as e:
-            logger.critical("ColumnInfo.from_json caught an exception.", exc_info=e)
-            raise ValueError("Invalid data passed to ColumnInfo.from_json: %s")
-        except KeyError as e:
-            logger.critical("ColumnInfo.from_json caught an exception.", exc_info=e)
-            raise ValueError("ColumnInfo data missing: %s", e)
-
-        for k in json_obj.keys():
-            if k not in ["index", "name", "unit"]:
+        if not TC.is_dict(json_obj):
+            raise ValueError("Invalid data passed to ColumnInfo.from_json: %s", json_obj)
+        if "index" not in json_obj or "name" not in json_obj:
+            raise ValueError("ColumnInfo data missing: %s", json_obj)
+        obj = cls(
+            index=json_obj["index"],
+            name=json_obj["name"],
+            unit=json_obj.get("unit", ""),
+        )
+
+        if logger.isEnabledFor(logging.WARNING):
+            for k in json_obj.keys() - _COLUMN_KEYS:
                 logger.warning("Unknown data for ColumnInfo.from_json: %s", k)
 
         obj.validate()
@@ -178,11 +199,41 @@ class ParameterInfo(object):
         0.01.
     """
 
+    __slots__ = ("column", "granularity")
+
     def __init__(self, column="", granularity=None):
         # type: (str, float)->None
-        self.column = column  # type: str
+        self.column = (
+            sys.intern(column) if isinstance(column, str) else column
+        )  # type: str
         self.granularity = granularity or None  # type: Optional[float]
 
+    def snap(self, values):
+        # type: (Any)->Any
+        """Round values onto the grid given by `!granularity`.
+
+        Parameters
+        ----------
+        values: float or numpy.ndarray or pandas.Series
+            The value, or a whole column of values, to be rounded.
+
+        Returns
+        -------
+        float or numpy.ndarray or pandas.Series
+            The rounded values; :ar:`values` itself if no granularity is set.
+
+        Note
+        ----
+        Columns should be snapped by one call to this method; the rounding is
+        then performed as a single vectorized operation.
+        """
+        if self.granularity is None:
+            return values
+        g = self.granularity
+        if numpy.ndim(values) == 0:
+            return round(values / g) * g
+        return numpy.round(values / g) * g
+
     @classmethod
     def from_json(cls, json_obj):
         # type: (Any)->ParameterInfo
@@ -203,19 +254,16 @@ class ParameterInfo(object):
         ValueError
             If :ar:`json_obj` has invalid data.
         """
-        try:
-            obj = cls(
-                column=json_obj["column"], granularity=json_obj.get("granularity")
+        if not TC.is_dict(json_obj):
+            raise ValueError(
+                "Invalid data passed to ParameterInfo.from_json: %s", json_obj
             )
-        except (TypeError, AttributeError) as e:
-            logger.critical("ParameterInfo.from_json caught an exception.", exc_info=e)
-            raise ValueError("Invalid data passed to ParameterInfo.from_json: %s")
-        except KeyError as e:
-            logger.critical("ParameterInfo.from_json caught an exception.", exc_info=e)
-            raise ValueError("ColumnInfo data missing: %s", e)
-
-        for k in json_obj.keys():
-            if k not in ["column", "granularity"]:
+        if "column" not in json_obj:
+            raise ValueError("ParameterInfo data missing: %s", json_obj)
+        obj = cls(column=json_obj["column"], granularity=json_obj.get("granularity"))
+
+        if logger.isEnabledFor(logging.WARNING):
+            for k in json_obj.keys() - _PARAMETER_KEYS:
                 logger.warning("Unknown data for ParameterInfo.from_json: %s", k)
 
         obj.validate()
@@ -293,6 +341,8 @@ class ValueInfo(object):
         Details are the same as `!unc_p`.
     """
 
+    __slots__ = ("column", "attributes", "unc_p", "unc_m")
+
     _valid_uncertainty_types = [
         "relative",
         "absolute",
@@ -310,7 +360,7 @@ class ValueInfo(object):
         unc_m=None,  # type: List[UncSpecType]
     ):
         # type: (...)->None
-        self.column = column
+        self.column = sys.intern(column) if isinstance(column, str) else column
         self.attributes = attributes or {}
         self.unc_p = unc_p or []
         self.unc_m = unc_m or []
@@ -350,13 +400,13 @@ class ValueInfo(object):
         if "column" not in json_obj:
             raise KeyError('Entry of "values" must have a key "column": %s', json_obj)
 
-        obj = cls()
-        obj.column = json_obj["column"]
+        obj = cls(column=json_obj["column"])
         obj.attributes = json_obj.get("attributes", {})
-        if ("unc" in json_obj) and ("unc+" in json_obj or "unc-" in json_obj):
+        symmetric_unc = json_obj.get("unc")
+        if symmetric_unc and ("unc+" in json_obj or "unc-" in json_obj):
             raise ValueError("Uncertainty duplicates: %s", obj.column)
         for attr_name, key_name in [("unc_p", "unc+"), ("unc_m", "unc-")]:
-            unc_def = json_obj.get(key_name) or json_obj.get("unc") or None
+            unc_def = json_obj.get(key_name) or symmetric_unc or None
             if unc_def is None:
                 logger.warning("Uncertainty (%s) missing for %s.", key_name, obj.column)
                 continue
@@ -364,7 +414,9 @@ class ValueInfo(object):
             try:
                 unc_list = [
                     (
-                        src["column"] if TC.is_list(src["column"]) else [src["column"]],
+                        [sys.intern(c) for c in src["column"]]
+                        if TC.is_list(src["column"])
+                        else [sys.intern(src["column"])],
                         src["type"],
                     )
                     for src in unc_def
@@ -387,12 +439,15 @@ class ValueInfo(object):
         dict(str, str or float)
             The json data describing the object.
         """
-        return {
+        json_obj = {
             "column": self.column,
             "attributes": self.attributes,
-            "unc+": [{"column": c, "type": t} for c, t in self.unc_p],
-            "unc-": [{"column": c, "type": t} for c, t in self.unc_m],
-        }
+        }  # type: MutableMapping[str, Any]
+        if self.unc_p:
+            json_obj["unc+"] = [{"column": c, "type": t} for c, t in self.unc_p]
+        if self.unc_m:
+            json_obj["unc-"] = [{"column": c, "type": t} for c, t in self.unc_m]
+        return json_obj
 
 
 class FileInfo(object):
@@ -414,27 +469,36 @@ class FileInfo(object):
 
     Attributes
     ----------
-    document : dict(Any, Any)
+    document : mapping(Any, Any)
         Any information for documentation without physical meanings.
-    columns : list of ColumnInfo
-        The list of columns.
-    parameters: list of ParameterInfo
-        The list of parameters to define a data point.
-    values: list of ValueInfo
-        The list of values described in the file.
-    reader_options: dict(str, Any)
+    columns : sequence of ColumnInfo
+        The sequence of columns.
+    parameters: sequence of ParameterInfo
+        The sequence of parameters to define a data point.
+    values: sequence of ValueInfo
+        The sequence of values described in the file.
+    reader_options: mapping(str, Any)
         Options to read the CSV
 
         The values are directly passed to :func:`pandas.read_csv` as keyword
         arguments, so all the options of :func:`pandas.read_csv` are available.
     """
 
+    __slots__ = (
+        "document",
+        "columns",
+        "parameters",
+        "values",
+        "reader_options",
+        "_validated",
+    )
+
     def __init__(
         self,
         document=None,  # type: Mapping[Any, Any]
-        columns=None,  # type: List[ColumnInfo]
-        parameters=None,  # type: List[ParameterInfo]
-        values=None,  # type: List[ValueInfo]
+        columns=None,  # type: Sequence[ColumnInfo]
+        parameters=None,  # type: Sequence[ParameterInfo]
+        values=None,  # type: Sequence[ValueInfo]
         reader_options=None,  # type: Mapping[str, Any]
     ):
         # type: (...)->None
@@ -443,10 +507,18 @@ class FileInfo(object):
         self.parameters = parameters or []
         self.values = values or []
         self.reader_options = reader_options or {}
+        self._validated = False  # type: bool
 
-    def validate(self):
-        # type: ()->None
-        """Validate the content."""
+    def validate(self, force=False):
+        # type: (bool)->None
+        """Validate the content.
+
+        A successful validation is remembered and the checks are skipped on
+        subsequent calls, unless :ar:`force` is specified or the content is
+        reloaded in between.
+        """
+        if self._validated and not force:
+            return
         assert TC.is_dict(self.document), "document must be a dict."
         for name in ["columns", "parameters", "values"]:
             assert TC.is_list(getattr(self, name)), "FileInfo.%s must be a list" % name
@@ -456,10 +528,9 @@ class FileInfo(object):
             self.reader_options, key_type=str
         ), "reader_options must be a dict(str, Any)."
 
-        # validate columns (`index` matches actual index, names are unique)
+        # validate columns (names are unique); `index` is guaranteed by _load.
         names_dict = {}  # type: MutableMapping[str, bool]
-        for i, col in enumerate(self.columns):
-            assert col.index == i, "Mismatched column index: %d/%d" % (i, col.index)
+        for col in self.columns:
             assert col.name not in names_dict, "Duplicated column name: " + col.name
             names_dict[col.name] = True
 
@@ -472,6 +543,15 @@ class FileInfo(object):
                 for c in col_list:
                     assert c in names_dict, "Unknown column name: %s" % c
 
+        # freeze the content so that validated instances can be shared
+        # (e.g. among threads) without defensive copies.
+        self.columns = tuple(self.columns)
+        self.parameters = tuple(self.parameters)
+        self.values = tuple(self.values)
+        self.document = types.MappingProxyType(dict(self.document))
+        self.reader_options = types.MappingProxyType(dict(self.reader_options))
+        self._validated = True
+
     @classmethod
     def load(cls, source):
         # type: (Union[pathlib.Path, str])->FileInfo
@@ -488,22 +568,36 @@ class FileInfo(object):
             Constructed instance.
         """
         obj = cls()
-        with open(source.__str__()) as f:  # py2
-            obj._load(**(json.load(f)))
+        # binary mode: json sniffs the encoding itself and we skip the
+        # text-io decoding layer.
+        with open(source.__str__(), "rb") as f:  # py2
+            obj._load_from_dict(json.loads(f.read()))
         obj.validate()
         return obj
 
     def _load(self, **kw):
         # type: (Any)->None
-        """Load and construct FileInfo from keyword arguments.
+        """Load and construct FileInfo from keyword arguments."""
+        self._load_from_dict(kw)
+
+    def _load_from_dict(self, kw):
+        # type: (Mapping[str, Any])->None
+        """Load and construct FileInfo from a json-parsed dict.
+
+        Accepting the dict directly avoids repacking the parsed json data
+        into a keyword-argument dict for every load.
 
         Note that file-level "attributes" are passed to each `ValueInfo` object
         as the default values and overwritten by value-level "attributes".
         """
+        self._validated = False  # content is being replaced
         self.document = kw.get("document") or {}
         self.reader_options = kw.get("reader_options") or {}
+        # tight loop with local alias; the enumeration guarantees valid indices
+        # so that validate() does not need to re-check them.
+        col_info = ColumnInfo
         self.columns = [
-            ColumnInfo(index=i, name=c.get("name"), unit=c.get("unit"))
+            col_info(i, c.get("name"), c.get("unit"))
             for i, c in enumerate(kw.get("columns") or [])
         ]
         self.parameters = [
@@ -519,17 +613,10 @@ class FileInfo(object):
             v.attributes.update(orig)
 
         # emit warnings
-        if not self.document:
-            logger.warning("No document is given.")
-        for key in kw:
-            if key not in [
-                "document",
-                "columns",
-                "parameters",
-                "values",
-                "reader_options",
-                "attributes",
-            ]:
+        if logger.isEnabledFor(logging.WARNING):
+            if not self.document:
+                logger.warning("No document is given.")
+            for key in kw.keys() - _FILE_KEYS:
                 logger.warning('Unrecognized attribute "%s"', key)
 
     def get_column(self, name):
@@ -15,6 +15,7 @@ import logging
 import pathlib  # noqa: F401
 import sys
 from typing import (  # noqa: F401
+    TYPE_CHECKING,
     Any,
     Generic,
     List,
@@ -28,9 +29,11 @@ from typing import (  # noqa: F401
     cast,
 )
 
-import pandas
 import numpy
 
+if TYPE_CHECKING:
+    import pandas  # noqa: F401  # deferred to keep import-time light
+
 from susy_cross_section.base.info import FileInfo, UncSpecType, ValueInfo
 from susy_cross_section.utility import Unit
 
@@ -66,6 +69,8 @@ class BaseTable(object):
 
     def __init__(self, obj=None, file=None, name=None):
         # type:(pandas.DataFrame, Optional[BaseFile[BaseTable]], Optional[str])->None
+        import pandas  # noqa: F811  # deferred import, see module top
+
         if isinstance(obj, pandas.DataFrame):
             self._df = obj  # type: pandas.DataFrame
         else:
@@ -81,8 +86,23 @@ class BaseTable(object):
     def __setitem__(self, name, obj):
         # type: (str, Any)->Any
         """Perform DataFrame.__setitem__."""
+        self.__dict__.pop("_unc_m_abs", None)  # drop the cache on mutation
         return self._df.__setitem__(name, obj)
 
+    @property
+    def unc_m_abs(self):
+        # type: ()->pandas.Series
+        """Return the absolute values of the "unc-" column.
+
+        The column is computed once per table; interpolating a table with
+        several interpolators reuses the result.
+        """
+        cached = self.__dict__.get("_unc_m_abs")
+        if cached is None:
+            cached = self._df["unc-"].abs()
+            self.__dict__["_unc_m_abs"] = cached
+        return cached
+
     def __getitem__(self, name):
         # type: (str)->Any
         """Perform DataFrame.__getitem__."""
@@ -173,6 +193,8 @@ class BaseFile(Generic[TableT]):
 
         Internally, call `pandas.read_csv` with `!reader_options`.
         """
+        import pandas  # noqa: F811  # deferred import, see module top
+
         reader_options = {
             "skiprows": [0],
             "names": [c.name for c in self.info.columns],
@@ -214,14 +236,9 @@ class BaseFile(Generic[TableT]):
         """Quantize parameters and normalize columns to value_info.column."""
         data = self.raw_data.copy()
 
-        def quantize(data_frame, granularity):
-            # type: (pandas.DataFrame, float)->pandas.DataFrame
-            return (data_frame / granularity).apply(round) * granularity
-
         # set index by the quantized values
         for p in self.info.parameters:
-            if p.granularity:
-                data[p.column] = quantize(data[p.column], p.granularity)
+            data[p.column] = p.snap(data[p.column])
         data.set_index([p.column for p in self.info.parameters], inplace=True)
 
         # collect columns to use
@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import, division, print_function  # py2
 
+import functools
 import pathlib
 from typing import Mapping, Optional, Tuple, Union  # noqa: F401
 
@@ -106,10 +107,14 @@ def parse_table_value(obj):
         return obj, None
 
 
+@functools.lru_cache(maxsize=None)
 def table_paths(key, absolute=False):
     # type: (str, bool)->Tuple[Optional[pathlib.Path], Optional[pathlib.Path]]
     """Return the relative paths to table file and info file.
 
+    The results are cached; if :data:`table_names` is ever modified, the
+    cache must be dropped by ``table_paths.cache_clear()``.
+
     Parameters
     ----------
     key: str
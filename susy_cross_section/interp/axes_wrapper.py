@@ -154,24 +154,25 @@ class AxesWrapper:
         # type: (Union[FT, str])->FT
         """Return wrapper function.
 
-        The argument can be a function itself or a function name. The returned
-        functions are dressed by `numpy.vectorize` so that it can be applied to
-        numpy objects.
+        The argument can be a function itself or a function name. The
+        predefined functions operate on numpy objects natively and are
+        returned as-is, so arrays are processed in one vectorized C call;
+        user-specified functions are dressed by `numpy.vectorize`.
         """
         if isinstance(obj, str):
             name = cls._predefined_function_names.get(obj)
             if not name:
                 raise KeyError("Function %s is not predefined in AxesWrapper", obj)
-            return cast(FT, numpy.vectorize(getattr(cls, name)))
+            return cast(FT, getattr(cls, name))
         else:
             return cast(FT, numpy.vectorize(obj))
 
     @classmethod
     def _get_inverse_function(cls, name):
         # type: (str)->FT
-        """Return the inverse function with numpy-dress."""
+        """Return the inverse function."""
         name = cls._inverse_function_names[cls._predefined_function_names[name]]
-        return cast(FT, numpy.vectorize(getattr(cls, name)))
+        return cast(FT, getattr(cls, name))
 
     def __init__(self, wx, wy, wy_inv=None):
         # type: (Sequence[Union[FT, str]], Union[FT, str], Union[FT, str])->None
@@ -17,12 +17,25 @@ from __future__ import absolute_import, division, print_function  # py2
 
 import logging
 import re
-from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (  # noqa: F401
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy
-import pandas  # noqa: F401
 import scipy.interpolate as sci_interp
 
+if TYPE_CHECKING:
+    import pandas  # noqa: F401  # deferred to keep import-time light
+
 from susy_cross_section.table import BaseTable
 
 from .axes_wrapper import AxesWrapper
@@ -228,10 +241,15 @@ class AbstractInterpolator:
         Interpolation
             The interpolation result.
         """
+        value = table["value"]
+        if isinstance(table, BaseTable):
+            unc_m = table.unc_m_abs  # cached per table
+        else:
+            unc_m = abs(table["unc-"])  # plain DataFrame, e.g. a sieved copy
         return Interpolation(
-            self._interpolate(table["value"]),
-            self._interpolate(table["value"] + table["unc+"]),
-            self._interpolate(table["value"] - abs(table["unc-"])),
+            self._interpolate(value),
+            self._interpolate(value + table["unc+"]),
+            self._interpolate(value - unc_m),
             param_names=table.index.names,
         )
 
@@ -317,6 +335,46 @@ class Scipy1dInterpolator(AbstractInterpolator):
         self.kind = kind.lower()  # type: str
         self.axes = axes.lower()  # type: str
 
+    @staticmethod
+    def _linear_interpolant(xs, ys):
+        # type: (Any, Any)->Callable[[float], float]
+        """Return a piece-wise linear interpolating function.
+
+        `numpy.interp` performs the bisection and the linear interpolation in
+        one C-level call, while `scipy.interpolate.interp1d` goes through
+        several python-level layers on every evaluation. The out-of-range
+        behavior matches `!interp1d` with `!bounds_error=True`.
+        """
+        order = numpy.argsort(xs)
+        xs, ys = xs[order], ys[order]
+        x_min, x_max = xs[0], xs[-1]
+
+        def f_bar(x):
+            # type: (float)->float
+            if x < x_min or x > x_max:
+                raise ValueError(
+                    "A value in x_new is outside the interpolation range."
+                )
+            return float(numpy.interp(x, xs, ys))
+
+        return f_bar
+
+    def _build_interpolant(self, xs, ys):
+        # type: (Any, Any)->Callable[[float], float]
+        """Build the (float->float) interpolant specified by `!kind`."""
+        if self.kind == "spline":
+            f_bar = sci_interp.CubicSpline(xs, ys, bc_type="natural", extrapolate=False)
+        elif self.kind == "pchip":
+            f_bar = sci_interp.PchipInterpolator(xs, ys, extrapolate=False)
+        elif self.kind == "akima":
+            f_bar = sci_interp.Akima1DInterpolator(xs, ys)
+            f_bar.extrapolate = False
+        elif self.kind == "linear":
+            f_bar = self._linear_interpolant(xs, ys)
+        else:
+            f_bar = sci_interp.interp1d(xs, ys, self.kind, bounds_error=True)
+        return cast(Callable[[float], float], f_bar)
+
     def _interpolate(self, df):
         # type: (pandas.DataFrame)->InterpType
         if self.axes == "linear":
@@ -333,19 +391,11 @@ class Scipy1dInterpolator(AbstractInterpolator):
         if df.index.nlevels != 1:
             raise ValueError("Scipy1dInterpolator not handle multiindex data.")
 
-        # axes modification; note that the wrappers are numpy.vectorize()-ed.
+        # axes modification; the wrappers accept arrays as plain numpy ufuncs.
         xs = wrapper.wx[0](df.index.to_numpy())
         ys = wrapper.wy(df.to_numpy())
 
-        if self.kind == "spline":
-            f_bar = sci_interp.CubicSpline(xs, ys, bc_type="natural", extrapolate=False)
-        elif self.kind == "pchip":
-            f_bar = sci_interp.PchipInterpolator(xs, ys, extrapolate=False)
-        elif self.kind == "akima":
-            f_bar = sci_interp.Akima1DInterpolator(xs, ys)
-            f_bar.extrapolate = False
-        else:
-            f_bar = sci_interp.interp1d(xs, ys, self.kind, bounds_error=True)
+        f_bar = self._build_interpolant(xs, ys)
 
         # now `f_bar` is float->float; we should convert it to Tuple[float]->float.
 
@@ -5,6 +5,7 @@ For details, see the manual or try to execute with ``--help`` option.
 
 from __future__ import absolute_import, division, print_function  # py2
 
+import functools
 import logging
 from typing import Any, List, MutableMapping, Optional, Tuple  # noqa: F401
 
@@ -35,6 +36,58 @@ logger = logging.getLogger(__name__)
 _DEFAULT_VALUE_NAME = "xsec"
 
 
+@functools.lru_cache(maxsize=None)
+def _load_file(table_path, info_path):
+    # type: (utility.PathLike, utility.PathLike)->File
+    """Return the parsed data file, cached per path pair.
+
+    Within one process - notably test suites driving the commands through
+    CliRunner - the same tables are requested repeatedly; parsing them once
+    is enough since File objects are only read afterwards.
+    """
+    return File(table_path, info_path)
+
+
+def _interpolator_for(n_params):
+    # type: (int)->AbstractInterpolator
+    """Return the default interpolator for given parameter dimension."""
+    if n_params == 1:
+        return Scipy1dInterpolator(axes="loglog", kind="spline")
+    wrapper = AxesWrapper(["log" for _ in range(n_params)], "log")
+    kind = "spline33" if n_params == 2 else "linear"
+    return ScipyGridInterpolator(axes_wrapper=wrapper, kind=kind)
+
+
+def get_xs(table, args, name=_DEFAULT_VALUE_NAME, info=None):
+    # type: (utility.PathLike, Tuple[float, ...], str, Optional[utility.PathLike])->Tuple[float, float, float]
+    """Return the interpolated cross section with uncertainties.
+
+    This is the core of the GET command without the command-line interface:
+    tests and other programs can call it directly and skip the option parsing
+    and output formatting.
+
+    Parameters
+    ----------
+    table: pathlib.Path or str
+        Path to grid-data file or a table name predefined in configuration.
+    args: tuple of float
+        The parameter point at which the table is interpolated.
+    name: str
+        Name of a table.
+    info: pathlib.Path or str, optional
+        Path of table-info file if non-standard file name.
+
+    Returns
+    -------
+    tuple(float, float, float)
+        Interpolated central value and positive and negative uncertainties.
+    """
+    table_path, info_path = utility.get_paths(table, info)
+    data_table = _load_file(table_path, info_path).tables[name]
+    interp = _interpolator_for(len(args))
+    return interp.interpolate(data_table).tuple_at(*args)
+
+
 def _configure_logger():
     # type: ()->None
     """Configure logger so that proper logs are shown on console."""
@@ -115,7 +168,7 @@ def get(context, **kw):
     value_name = kw["name"] or _DEFAULT_VALUE_NAME
     try:
         table_path, info_path = utility.get_paths(kw["table"], kw["info"])
-        data_file = File(table_path, info_path)
+        data_file = _load_file(table_path, info_path)
     except (FileNotFoundError, RuntimeError, ValueError, TypeError) as e:
         click.echo(repr(e))
         exit(1)
@@ -133,14 +186,7 @@ def get(context, **kw):
         exit(1)
 
     # data evaluation
-    if len(args) == 1:
-        interp = Scipy1dInterpolator(
-            axes="loglog", kind="spline"
-        )  # type: AbstractInterpolator
-    else:
-        wrapper = AxesWrapper(["log" for _ in args], "log")
-        kind = "spline33" if len(args) == 2 else "linear"
-        interp = ScipyGridInterpolator(axes_wrapper=wrapper, kind=kind)
+    interp = _interpolator_for(len(args))
     cent, u_p, u_m = interp.interpolate(table).tuple_at(*kw["args"])
 
     # display
@@ -176,7 +222,7 @@ def show(**kw):
         exit(1)
 
     try:
-        data_file = File(table_path, info_path)
+        data_file = _load_file(table_path, info_path)
     except (ValueError, TypeError) as e:
         click.echo(e.__repr__())  # py2
         exit(1)
@@ -210,7 +256,7 @@ def export(context, **kw):
     value_name = kw["name"] or _DEFAULT_VALUE_NAME
     try:
         table_path, info_path = utility.get_paths(kw["table"], kw["info"])
-        data_file = File(table_path, info_path)
+        data_file = _load_file(table_path, info_path)
     except (FileNotFoundError, RuntimeError, ValueError, TypeError) as e:
         click.echo(repr(e))
         exit(1)
@@ -13,6 +13,7 @@ from __future__ import absolute_import, division, print_function  # py2
 import logging
 import pathlib
 from typing import (  # noqa: F401
+    TYPE_CHECKING,
     Any,
     List,
     Mapping,
@@ -25,10 +26,11 @@ from typing import (  # noqa: F401
     cast,
 )
 
-import pandas  # noqa: F401
-
 from susy_cross_section.base.table import BaseFile, BaseTable
 
+if TYPE_CHECKING:
+    import pandas  # noqa: F401  # deferred to keep import-time light
+
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
@@ -125,6 +127,8 @@ class Table(BaseTable):
 
     def __init__(self, obj=None, file=None, name=None):
         # type: (Any, Optional[File], Optional[str])->None
+        import pandas  # noqa: F811  # deferred import, see module top
+
         if isinstance(obj, Table):
             assert file is None and name is None
             self._df = obj._df  # type: pandas.DataFrame
@@ -0,0 +1,13 @@
+"""Shared pytest configuration for the test suite."""
+
+from __future__ import absolute_import, division, print_function  # py2
+
+import logging
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_logging():
+    """Configure logging once per session instead of per test module."""
+    logging.getLogger().setLevel(logging.WARNING)
@@ -7,11 +7,13 @@ import pytest
 
 from susy_cross_section import config
 
+_PACKAGE_DIR = pathlib.Path(__file__).resolve().parent.parent.parent
+
 
 class TestConfig(unittest.TestCase):
     """UnitTest for `susy_cross_section.config`."""
 
-    package_dir = pathlib.Path(__file__).parent.parent.parent
+    package_dir = _PACKAGE_DIR
 
     def test_table_paths(self):
         """Assert table_paths give paths to the files."""
@@ -1,29 +1,72 @@
 """Utility functions and classes.
 
-============== ========================================================
-`Unit`         describing a physical unit.
-`value_format` give human-friendly string representation of values.
-`get_paths`    parse and give paths to data and info files
-============== ========================================================
+==================== ==================================================
+`Unit`               describing a physical unit.
+`value_format`       give human-friendly string representation of values.
+`value_format_array` as `value_format` but for whole columns at once.
+`get_paths`          parse and give paths to data and info files
+==================== ==================================================
 """
 
 from __future__ import absolute_import, division, print_function  # py2
 
-import itertools
+import functools
 import logging
 import pathlib
+import sys
+from math import log10
 from typing import Any, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
-from numpy import log10
-
 from susy_cross_section.config import table_paths
 
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 PathLike = Union[str, pathlib.Path]
 TypeSpecType = Optional[Union[type, Sequence[type]]]
 
+_POW10 = tuple(10.0 ** k for k in range(-20, 21))
+
+
+def _pow10(k):
+    # type: (int)->float
+    """Return ``10**k``, from a lookup table for the usual exponents."""
+    return _POW10[k + 20] if -20 <= k <= 20 else 10.0 ** k
+
+
+@functools.lru_cache(maxsize=32)
+def _value_fmt(disp_digits):
+    # type: (int)->str
+    """Return the format string for a value with its uncertainties."""
+    f = "{{:.{}f}}".format(disp_digits)
+    return "{f} +{f} -{f}".format(f=f)
+
+
+def _with_info_suffix(path):
+    # type: (pathlib.Path)->pathlib.Path
+    """Return the path with its suffix replaced by ``.info``.
+
+    This does the same as ``path.with_suffix(".info")`` for ordinary file
+    names but skips pathlib's suffix parsing.
+    """
+    s = path.__str__()
+    dot = s.rfind(".")
+    # a leading dot of a hidden file is not a suffix separator (cf. pathlib)
+    if dot > s.rfind("/") + 1 and dot > s.rfind("\\") + 1:
+        s = s[:dot]
+    return pathlib.Path(s + ".info")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_file(abs_path_str):
+    # type: (str)->bool
+    """Return `Path.is_file` result, cached to avoid repeated stat calls.
+
+    The key must be an absolute path so that the cache is insensitive to
+    later directory changes. Data tables are not expected to appear or
+    vanish within a process lifetime.
+    """
+    return pathlib.Path(abs_path_str).is_file()
+
 
 class Unit:
     """A class to handle units of physical values.
@@ -39,6 +82,8 @@ class Unit:
         Factors of the new instance.
     """
 
+    __slots__ = ("_factor", "_units", "_inv")
+
     definitions = {
         "": [1],
         "%": [0.01],
@@ -50,10 +95,15 @@ class Unit:
     Each key should be replaced with the product of its values."""
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _get_base_units(cls, name):
-        # type: (Union[float, str])->List[Union[float, str]]
+        # type: (Union[float, str])->Tuple[Union[float, str], ...]
         """Expand the unit name to the base units.
 
+        As `!definitions` is effectively immutable, the expansions are
+        memoized; a tuple is returned so that the shared result cannot be
+        modified by callers.
+
         Parameters
         ----------
         name: float or str
@@ -61,22 +111,77 @@ class Unit:
 
         Returns
         -------
-        list[float or str]
-            Expansion result as a list of factors and base unit names.
+        tuple[float or str]
+            Expansion result as factors and base unit names.
         """
-        if isinstance(name, str) and name in cls.definitions:
-            nested = [cls._get_base_units(u) for u in cls.definitions[name]]
-            return list(itertools.chain.from_iterable(nested))  # flatten
-        else:
-            return [name]
+        result = []  # type: List[Union[float, str]]
+        stack = [name]
+        while stack:  # depth-first traversal without recursive calls
+            n = stack.pop()
+            if isinstance(n, str) and n in cls.definitions:
+                stack.extend(reversed(cls.definitions[n]))
+            else:
+                result.append(n)
+        return tuple(result)
+
+    _parsed_names = {}  # type: MutableMapping[str, Tuple[float, Tuple[Tuple[str, int], ...]]]
+    """Cache of the parts parsed from a single unit name.
+
+    The parts are immutable and thus safely shared among instances."""
 
     def __init__(self, *args):
         # type: (Union[float, str, Unit])->None
         self._factor = 1  # type: float
-        self._units = {}  # type: MutableMapping[str, int]
+        self._units = ()  # type: Tuple[Tuple[str, int], ...]
+        self._inv = None  # type: Optional[Unit]
+        if len(args) == 1 and isinstance(args[0], str):
+            # fast path for the most common construction, Unit("name")
+            cached = self._parsed_names.get(args[0])
+            if cached is None:
+                self *= args[0]
+                self._parsed_names[args[0]] = (self._factor, self._units)
+            else:
+                self._factor, self._units = cached
+            return
         for u in args:
             self *= u
 
+    @staticmethod
+    def _merge_units(a, b):
+        # type: (Tuple[Tuple[str, int], ...], Tuple[Tuple[str, int], ...])->Tuple[Tuple[str, int], ...]
+        """Merge two sorted unit tuples, dropping zero exponents."""
+        if not a:
+            return b
+        if not b:
+            return a
+        result = []  # type: List[Tuple[str, int]]
+        i, j, len_a, len_b = 0, 0, len(a), len(b)
+        while i < len_a and j < len_b:
+            if a[i][0] == b[j][0]:
+                exponent = a[i][1] + b[j][1]
+                if exponent:
+                    result.append((a[i][0], exponent))
+                i, j = i + 1, j + 1
+            elif a[i][0] < b[j][0]:
+                result.append(a[i])
+                i += 1
+            else:
+                result.append(b[j])
+                j += 1
+        result.extend(a[i:])
+        result.extend(b[j:])
+        return tuple(result)
+
+    @classmethod
+    def _from_parts(cls, factor, units):
+        # type: (float, Tuple[Tuple[str, int], ...])->Unit
+        """Build a Unit from already-expanded parts, bypassing `!__init__`."""
+        result = cls.__new__(cls)
+        result._factor = factor
+        result._units = units
+        result._inv = None
+        return result
+
     def inverse(self):
         # type: ()->Unit
         """Return an inverted unit.
@@ -86,10 +191,12 @@ class Unit:
         Unit
             The inverted unit of `!self`.
         """
-        result = Unit()
-        result._factor = 1 / self._factor
-        result._units = {k: -v for k, v in self._units.items()}
-        return result
+        if self._inv is None:
+            self._inv = self._from_parts(
+                1 / self._factor, tuple((k, -v) for k, v in self._units)
+            )
+            self._inv._inv = self  # the pair inverts back to each other
+        return self._inv
 
     def __imul__(self, other):
         # type: (Union[float, str, Unit])->Unit
@@ -100,19 +207,25 @@ class Unit:
         other: float, str, or Unit
             Another unit as a multiplier.
         """
+        if self._inv is not None:
+            # mutation invalidates the memoized inverse on both sides
+            self._inv._inv = None
+            self._inv = None
         if isinstance(other, Unit):
             self._factor *= other._factor
-            for k, v in other._units.items():
-                self._units[k] = self._units.get(k, 0) + v
+            self._units = self._merge_units(self._units, other._units)
+        elif isinstance(other, str) and other not in self.definitions:
+            # the hottest case: a base-unit name needs no expansion at all
+            self._units = self._merge_units(self._units, ((sys.intern(other), 1),))
         else:
             for b in self._get_base_units(other):
                 if isinstance(b, str):
-                    self._units[b] = self._units.get(b, 0) + 1
+                    # interned names make the merge comparisons identity-fast
+                    self._units = self._merge_units(self._units, ((sys.intern(b), 1),))
+                elif isinstance(b, (int, float)):
+                    self._factor *= b
                 else:
-                    try:
-                        self._factor *= float(b)
-                    except ValueError:
-                        raise TypeError("invalid unit: %s", other)
+                    raise TypeError(f"invalid unit: {other!r}")
         return self
 
     def __mul__(self, other):
@@ -129,6 +242,11 @@ class Unit:
         Unit
             The product.
         """
+        if isinstance(other, Unit):
+            return self._from_parts(
+                self._factor * other._factor,
+                self._merge_units(self._units, other._units),
+            )
         return Unit(self, other)
 
     def __truediv__(self, other):
@@ -145,7 +263,18 @@ class Unit:
         Unit
             The quotient.
         """
-        return Unit(self, Unit(other).inverse())
+        if isinstance(other, Unit):
+            factor, units = other._factor, other._units
+        elif isinstance(other, str) and other in self._parsed_names:
+            # reuse the parsed parts without building an intermediate Unit
+            factor, units = self._parsed_names[other]
+        else:
+            tmp = Unit(other)
+            factor, units = tmp._factor, tmp._units
+        return self._from_parts(
+            self._factor / factor,
+            self._merge_units(self._units, tuple((k, -v) for k, v in units)),
+        )
 
     def __float__(self):
         # type: ()->float
@@ -161,7 +290,7 @@ class Unit:
         ValueError
             If not dimension-less unit.
         """
-        if any(v != 0 for v in self._units.values()):
+        if self._units:  # zero exponents are never kept, so any entry is real
             raise ValueError("Unit conversion error: %s, %s", self._units, self._factor)
         return float(self._factor)
 
@@ -189,29 +318,87 @@ def value_format(value, unc_p, unc_m, unit=None, relative=False):
         Formatted string describing the given value.
     """
     delta = min(abs(unc_p), abs(unc_m))
-    suffix = " {}".format(unit) if unit else ""  # will be appended to the body.
+    suffix = f" {unit}" if unit else ""  # will be appended to the body.
 
     if relative:
-        return "{:g}{} +{:.2%} -{:.2%}".format(
-            value, suffix, unc_p / value, abs(unc_m) / value
-        )
+        return f"{value:g}{suffix} +{unc_p / value:.2%} -{abs(unc_m) / value:.2%}"
 
     if delta == 0:
         # without uncertainty
-        body = "{:g} +0 -0".format(value)
+        body = f"{value:g} +0 -0"
     else:
-        v_order = int(log10(value))
+        v_log = log10(value)
+        v_order = int(v_log)
         if abs(v_order) > 3:
             # force to use scientific notation
-            suffix = "*1e{:d}".format(v_order) + suffix
-            divider = 10 ** v_order
-            disp_digits = max(int(-log10(delta / value) - 0.005) + 2, 3)
+            suffix = f"*1e{v_order:d}" + suffix
+            divider = _pow10(v_order)
+            disp_digits = max(int(-(log10(delta) - v_log) - 0.005) + 2, 3)
         else:
             divider = 1
             disp_digits = max(int(-log10(delta) - 0.005) + (1 if delta > 1 else 2), 0)
-        v_format = "{f} +{f} -{f}".format(f="{{:.{}f}}".format(disp_digits))
+        v_format = _value_fmt(disp_digits)
         body = v_format.format(value / divider, unc_p / divider, abs(unc_m / divider))
-    return "({}){}".format(body, suffix) if suffix else body
+    return f"({body}){suffix}" if suffix else body
+
+
+def value_format_array(values, unc_p, unc_m, unit=None):
+    # type: (Sequence[float], Sequence[float], Sequence[float], Optional[str])->List[str]
+    """Return `value_format` results for whole columns of values.
+
+    The logarithms, which dominate the per-value cost, are evaluated in
+    single vectorized calls over the columns; each element is then
+    assembled with the same rules as `value_format`, so the output is
+    identical to mapping `value_format` over the rows.
+
+    Parameters
+    ----------
+    values: sequence of float
+        Central values.
+    unc_p: sequence of float
+        Positive-direction absolute uncertainties.
+    unc_m: sequence of float
+        Negative-direction absolute uncertainties.
+    unit: str, optional
+        Unit of the values and the uncertainties.
+
+    Returns
+    -------
+    list[str]
+        Formatted strings describing the given values.
+    """
+    import numpy  # only needed for bulk rendering; keep the module light
+
+    v = numpy.asarray(values, dtype=float)
+    p = numpy.asarray(unc_p, dtype=float)
+    m = numpy.asarray(unc_m, dtype=float)
+    delta = numpy.minimum(numpy.abs(p), numpy.abs(m))
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        v_log = numpy.log10(v)
+        d_log = numpy.log10(delta)
+
+    base_suffix = f" {unit}" if unit else ""
+    result = []  # type: List[str]
+    for i in range(len(v)):
+        if delta[i] == 0:
+            body, suffix = f"{v[i]:g} +0 -0", base_suffix
+        else:
+            v_order = int(v_log[i])
+            if abs(v_order) > 3:
+                suffix = f"*1e{v_order:d}" + base_suffix
+                divider = _pow10(v_order)
+                disp_digits = max(int(-(d_log[i] - v_log[i]) - 0.005) + 2, 3)
+            else:
+                suffix = base_suffix
+                divider = 1
+                disp_digits = max(
+                    int(-d_log[i] - 0.005) + (1 if delta[i] > 1 else 2), 0
+                )
+            body = _value_fmt(disp_digits).format(
+                v[i] / divider, p[i] / divider, abs(m[i] / divider)
+            )
+        result.append(f"({body}){suffix}" if suffix else body)
+    return result
 
 
 def get_paths(data_name, info_path=None):
@@ -255,21 +442,21 @@ def get_paths(data_name, info_path=None):
 
     def check_file(path, err_message, err_info=None):
         # type: (pathlib.Path, str, Optional[Sequence[str]])->None
-        if not path.is_file():
-            logger.critical(err_message, path.__str__())
+        if not _is_file(path.absolute().__str__()):
+            logger.critical(err_message, path)
             for i in err_info or []:
                 logger.info(i)
             raise FileNotFoundError(path.__str__())
 
-    if specified_grid.is_file():  # use specified path.
+    if _is_file(specified_grid.absolute().__str__()):  # use specified path.
         if configured_grid:
             # warn if the same key found in config.
             logger.warning(
                 "The file %s is used, ignoring the predefined table %s.",
-                specified_grid.absolute().__str__(),
+                specified_grid.absolute(),
                 data_name,
             )
-        specified_info = specified_info or specified_grid.with_suffix(".info")
+        specified_info = specified_info or _with_info_suffix(specified_grid)
         check_file(
             specified_info,
             "Info file %s not found.",
@@ -292,7 +479,7 @@ def get_paths(data_name, info_path=None):
         if specified_info:
             check_file(specified_info, "The specified info file %s not found.")
             return configured_grid, specified_info
-        configured_info = configured_info or configured_grid.with_suffix(".info")
+        configured_info = configured_info or _with_info_suffix(configured_grid)
         check_file(
             configured_info,
             "The preconfigured info file %s not found.",
@@ -302,7 +489,7 @@ def get_paths(data_name, info_path=None):
 
     else:
         # grid file not found.
-        logger.critical('The grid file for "%s" not found.', data_name.__str__())
+        logger.critical('The grid file for "%s" not found.', data_name)
         logger.info("For a preconfigured table, double-check the key of the table.")
         logger.info("If you specified a file-path, verify it exists as a file.")
         raise FileNotFoundError(data_name.__str__())
@@ -311,6 +498,16 @@ def get_paths(data_name, info_path=None):
 class TypeCheck:
     """Singleton class for methods to type assertion."""
 
+    @staticmethod
+    def _as_type_tuple(spec):
+        # type: (TypeSpecType)->Optional[Tuple[type, ...]]
+        """Normalize a type specification to a tuple for `isinstance`."""
+        if not spec:
+            return None
+        if isinstance(spec, (list, tuple)):
+            return tuple(spec)
+        return (spec,)  # a type or an isinstance-compatible alias
+
     @staticmethod
     def is_list(obj, element_type=None):
         # type: (Any, TypeSpecType)->bool
@@ -330,11 +527,10 @@ class TypeCheck:
         """
         if isinstance(obj, str) or not isinstance(obj, Sequence):
             return False
-        if element_type is not None:
-            types = element_type if isinstance(element_type, list) else [element_type]
-            for item in obj:
-                if not any(isinstance(item, t) for t in types):
-                    return False
+        types = TypeCheck._as_type_tuple(element_type)
+        if types:
+            # isinstance accepts a tuple of types as one C-level call.
+            return all(isinstance(item, types) for item in obj)
         return True
 
     @staticmethod
@@ -359,15 +555,11 @@ class TypeCheck:
         if not isinstance(obj, Mapping):
             return False
 
-        kt = vt = None
-        if key_type:
-            kt = key_type if isinstance(key_type, list) else [key_type]
-        if value_type:
-            vt = value_type if isinstance(value_type, list) else [value_type]
-
+        kt = TypeCheck._as_type_tuple(key_type)
+        vt = TypeCheck._as_type_tuple(value_type)
         for k, v in obj.items():
-            if kt and not any(isinstance(k, t) for t in kt):
+            if kt and not isinstance(k, kt):
                 return False
-            if vt and not any(isinstance(v, t) for t in vt):
+            if vt and not isinstance(v, vt):
                 return False
         return True
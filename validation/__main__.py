@@ -4,6 +4,9 @@ This code is supposed to be called from **the root directory of this
 repository** by ``python3 -m validation ARGS``.
 """
 
+import collections
+import concurrent.futures
+import functools
 import logging
 import pathlib
 
@@ -47,11 +50,31 @@ def _assert_using_local_package():
         exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_file(key):
+    # type: (str)->File
+    """Load a preconfigured file, shared among the subcommands."""
+    return File(*susy_cross_section.config.table_paths(key))
+
+
+_PREFETCH = 4
+"""The number of table files parsed ahead of the validator."""
+
+
 def _all_tables_iter(table_name="xsec"):
-    for key in susy_cross_section.config.table_names:
-        paths = susy_cross_section.config.table_paths(key)
-        logger.info("Evaluating: {}".format(paths[0]))
-        yield key, File(*paths).tables[table_name]
+    keys = list(susy_cross_section.config.table_names)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_PREFETCH) as ex:
+        # keep a bounded window of loads in flight so the validator works on
+        # one table while the next few are parsed; this bounds concurrent
+        # parses only — the _load_file cache keeps every File alive by design.
+        futures = collections.deque(
+            ex.submit(_load_file, key) for key in keys[:_PREFETCH]
+        )
+        for n, key in enumerate(keys):
+            if n + _PREFETCH < len(keys):
+                futures.append(ex.submit(_load_file, keys[n + _PREFETCH]))
+            logger.info("Evaluating: %s", susy_cross_section.config.table_paths(key)[0])
+            yield key, futures.popleft().result().tables[table_name]
 
 
 @click.group(
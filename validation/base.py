@@ -1,8 +1,9 @@
 """Base classes and utility functions for validators."""
 
+import functools
 import logging
 import pathlib
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot
 import matplotlib.style
@@ -18,6 +19,18 @@ PathLike = Union[str, pathlib.Path]
 LabelSpec = Union[bool, str]
 
 
+@functools.lru_cache(maxsize=None)
+def _column_units(columns):
+    # type: (Tuple[Any, ...])->Mapping[str, str]
+    """Return the column-name to unit mapping of an info file.
+
+    `FileInfo.validate` freezes `!columns` into a tuple, which serves as the
+    cache key; repeated label drawing then skips the linear `get_column`
+    scan per axis.
+    """
+    return {c.name: c.unit for c in columns}
+
+
 class BaseValidator:
     """Base class for validators."""
 
@@ -36,11 +49,13 @@ class BaseValidator:
             Whether to insert in log-scale or not.
         """
         if log:
-            return numpy.exp(BaseValidator.split_interval(numpy.log(seq)))
-        return numpy.concatenate(
-            [numpy.linspace(i, j, n, endpoint=None) for i, j in zip(seq, seq[1:])]
-            + [seq[-1:]]
-        )
+            return numpy.exp(BaseValidator.split_interval(numpy.log(seq), n=n))
+        d = numpy.asarray(seq, dtype=float)
+        # one broadcast instead of a linspace per interval; equivalent to
+        # concatenating linspace(i, j, n, endpoint=False) over the pairs.
+        t = numpy.arange(n) / n
+        grid = (d[:-1, None] + (d[1:] - d[:-1])[:, None] * t).ravel()
+        return numpy.concatenate([grid, d[-1:]])
 
     def __init__(self, output=None):
         # type: (Optional[Union[PdfPages, PathLike]])->None
@@ -64,6 +79,9 @@ class BaseValidator:
         # type: (matplotlib.figure.Figure)->None
         if self.pdf:
             self.pdf.savefig(fig)
+        # release the figure; pyplot otherwise keeps every figure alive in
+        # its global registry, so --all runs grow linearly in memory.
+        matplotlib.pyplot.close(fig)
 
     @staticmethod
     def label_with_unit(text, unit=None):
@@ -97,21 +115,15 @@ class BaseValidator:
             attrs = {"file_name": table.file.table_path.name}
             ax.set_title(title.format(**attrs))
 
+        units = _column_units(table.file.info.columns)
+
         x_name = x if isinstance(x, str) else table.index.names[0] if x else ""
         if x_name:
-            try:
-                x_unit = table.file.info.get_column(x_name).unit
-            except KeyError:
-                x_unit = ""
-            ax.set_xlabel(BaseValidator.label_with_unit(x_name, x_unit))
+            ax.set_xlabel(BaseValidator.label_with_unit(x_name, units.get(x_name, "")))
 
         y_name = y if isinstance(y, str) else table.name if y else ""
         if y_name:
-            try:
-                y_unit = table.file.info.get_column(y_name).unit
-            except KeyError:
-                y_unit = ""
-            ax.set_ylabel(BaseValidator.label_with_unit(y_name, y_unit))
+            ax.set_ylabel(BaseValidator.label_with_unit(y_name, units.get(y_name, "")))
 
     @staticmethod
     def set_labels_3d(ax, table, x=True, y=True, z="xsec", title=""):
@@ -128,11 +140,9 @@ class BaseValidator:
 
         z_name = z if isinstance(z, str) else table.name if z else ""
         if z_name:
-            try:
-                z_unit = table.file.info.get_column(z_name).unit
-                ax.set_zlabel(BaseValidator.label_with_unit(z_name, z_unit))
-            except KeyError:
-                pass
+            units = _column_units(table.file.info.columns)
+            if z_name in units:
+                ax.set_zlabel(BaseValidator.label_with_unit(z_name, units[z_name]))
 
     def compare(self, table, nllfast_cache_key=None):
         # type: (Table, Optional[str])->None
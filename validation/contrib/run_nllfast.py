@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 
 PathLike = Union[str, pathlib.Path]
 
+_WS = re.compile(r"  +")  # compiled once; used for every output line
+_VAR = re.compile(r"\$\{(.*?)\}")  # ${var} references in configuration values
+
 
 class Runner:
     """A program runner constructed from a configuration file."""
@@ -68,13 +71,17 @@ class Runner:
         logger.info("dir: %s", working_dir)
         logger.info("RUN: %s", " ".join(cmd))
         proc = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=working_dir
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=working_dir,
+            bufsize=1,
+            encoding="utf-8",
         )
-        while True:
-            line = proc.stdout.readline().decode()
-            yield line
-            if not line and proc.poll() is not None:
-                break
+        # text-mode iteration hands back whole lines from the buffer, with
+        # no per-line decode or poll() of the child.
+        yield from proc.stdout
+        proc.wait()
 
     def run(self, *args):
         # type: (Any)->None
@@ -108,7 +115,7 @@ class Runner:
 
         def replace(text):
             try:
-                return re.sub(r"\$\{(.*?)\}", lambda m: data[m.group(1)], text)
+                return _VAR.sub(lambda m: data[m.group(1)], text)
             except KeyError:
                 logger.critical("Invalid variable is used: %s", text)
                 exit(1)
@@ -120,15 +127,22 @@ class Runner:
     @classmethod
     def args_iter(cls, *args):
         # type: (str)->Iterator[Sequence[str]]
-        """Generate an interator using numpy.arange."""
-        iterators = []
+        """Generate an iterator over range-like argument specifications."""
+        iterators = []  # type: List[Any]
         for a in args:
-            if ":" in a:
-                s = [float(x) if "." in x else int(x) for x in a.split(":")]
-                iterators.append(numpy.arange(*s))
-            else:
+            if ":" not in a:
                 iterators.append([a])
-        return itertools.product(*iterators)
+                continue
+            s = [float(x) if "." in x else int(x) for x in a.split(":")]
+            if all(isinstance(x, int) for x in s):
+                iterators.append(range(*s))  # lazy and exact for integers
+            else:
+                # arange's count (ceil of the ratio, with an epsilon against
+                # rounding drift), but evenly-spaced points via linspace.
+                start, stop, step = s if len(s) == 3 else (*s, 1) if len(s) == 2 else (0, s[0], 1)
+                n = int(numpy.ceil((stop - start) / step - 1e-9))
+                iterators.append(numpy.linspace(start, start + step * (n - 1), n))
+        yield from itertools.product(*iterators)
 
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
@@ -153,7 +167,7 @@ def main(context, **kw):
     for args in r.args_iter(*kw["args"]):
         for line in r.run_iter(*args):
             if line.startswith("  "):
-                line = re.sub(r"  +", "\t", line.strip())
+                line = _WS.sub("\t", line.strip())
                 print(line)
             else:
                 logger.info(line.strip())
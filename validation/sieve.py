@@ -5,6 +5,7 @@ import logging
 import pathlib
 from typing import List, MutableMapping, Optional, Sequence, Union
 
+import numpy
 from pandas import DataFrame
 
 from susy_cross_section.interp.interpolator import AbstractInterpolator
@@ -39,8 +40,8 @@ class SievedTable:
             return tuple(table.index.levels[n].get_loc(k) for n, k in enumerate(key))
 
     @staticmethod
-    def sieve(table, signature, base):
-        # type: (DataFrame, Sequence[int], int)->DataFrame
+    def sieve(table, signature, base, levels=None):
+        # type: (DataFrame, Sequence[int], int, Optional[List[List[float]]])->DataFrame
         """Return a (new) sieved table with specified signature.
 
         Parameters
@@ -51,13 +52,23 @@ class SievedTable:
             The grids to remain; all the other grid lines are removed.
         base: int
             The sparseness of the sieving.
+        levels: List[List[float]], optional
+            Precomputed `get_levels` result, for callers sieving the same
+            table repeatedly.
         """
-        t = table.copy()
-        levels = SievedTable.get_levels(table)
+        if levels is None:
+            levels = SievedTable.get_levels(table)
         assert len(signature) == len(levels)
-        for level, points in enumerate(levels):
-            to_sieve = [p for i, p in enumerate(points) if i % base != signature[level]]
-            t.drop(to_sieve, inplace=True, level=level if level > 0 else None)
+        try:
+            codes = table.index.codes  # per-row positions within each level
+        except AttributeError:
+            codes = [numpy.arange(len(table.index))]
+        # one positional mask and one selection instead of a label-based
+        # drop (and index rebuild) per level
+        mask = numpy.ones(len(table.index), dtype=bool)
+        for level, level_codes in enumerate(codes):
+            mask &= numpy.asarray(level_codes) % base == signature[level]
+        t = table[mask]
         try:
             # For MultiIndex, https://stackoverflow.com/questions/28772494/
             t.index = t.index.remove_unused_levels()
@@ -72,7 +83,7 @@ class SievedTable:
         levels = SievedTable.get_levels(table)
         result = {}  # type: MutableMapping[Sequence[int], DataFrame]
         for signature in itertools.product(range(base), repeat=len(levels)):
-            result[signature] = SievedTable.sieve(table, signature, base)
+            result[signature] = SievedTable.sieve(table, signature, base, levels=levels)
         return result
 
     def __init__(self, table, base=2):
@@ -93,8 +104,14 @@ class SievedInterpolations:
         self._sieved = SievedTable(table, base)
         self._interpolations = {
             signature: interpolator.interpolate(sieved_table)
-            for signature, sieved_table in SievedTable(table, base=base).tables.items()
+            for signature, sieved_table in self._sieved.tables.items()
         }
+        # grid-value to (position % base) maps, so that signature lookups in
+        # __call__ avoid a pandas get_loc per level per point.
+        self._grid_locs = [
+            {value: i % base for i, value in enumerate(points)}
+            for points in SievedTable.get_levels(table)
+        ]
 
     @property
     def interpolations(self):
@@ -108,8 +125,9 @@ class SievedInterpolations:
     def __call__(self, args):
         # type: (Sequence[float])->float
         """Calculate sieved-interpolated values for a given table."""
-        loc = self._sieved.get_loc_list(self._table, args, self._base)
-        signature = tuple(self._negate(x) for x in loc)  # use the farthest
+        signature = tuple(  # use the farthest
+            self._negate(locs[x]) for locs, x in zip(self._grid_locs, args)
+        )
         return self._interpolations[signature](*args)
 
     def interpolated_table(self):
@@ -122,9 +140,12 @@ class SievedInterpolations:
                 result.index = result.index.remove_unused_levels()
         else:
             result.drop([result.index[0], result.index[-1]], inplace=True)
-        for key, row in result.iterrows():
-            interp = self(key if is_multi else (key,))
-            badness = (interp - row["value"]) / min(row["unc+"], row["unc-"])
-            result.loc[key, "interpolation"] = interp
-            result.loc[key, "badness"] = badness
+        interps = numpy.fromiter(
+            (self(key if is_multi else (key,)) for key in result.index),
+            dtype=float,
+            count=len(result.index),
+        )
+        unc = numpy.minimum(result["unc+"].to_numpy(), result["unc-"].to_numpy())
+        result["interpolation"] = interps
+        result["badness"] = (interps - result["value"].to_numpy()) / unc
         return result
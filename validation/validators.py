@@ -2,7 +2,17 @@
 
 import logging
 import pathlib
-from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import matplotlib
 import matplotlib.style
@@ -10,8 +20,10 @@ import numpy
 import pandas
 from matplotlib.axes import Axes
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
 from matplotlib.pyplot import cm
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from pandas import DataFrame
 
 from susy_cross_section.interp.axes_wrapper import AxesWrapper
@@ -32,6 +44,17 @@ logger = logging.getLogger(__name__)
 
 nllfast_cache_dir = pathlib.Path(__file__).parent / "contrib" / "nllfast-cache"
 
+_style_applied = False
+
+
+def _apply_style():
+    # type: ()->None
+    """Apply the plot style once; rcParams parsing is global and not cheap."""
+    global _style_applied
+    if not _style_applied:
+        matplotlib.style.use("seaborn-whitegrid")
+        _style_applied = True
+
 
 def choose_validator(table):
     # type: (Table)->type
@@ -59,20 +82,35 @@ class OneDimValidator(BaseValidator):
     def __init__(self, output=None):
         # type: (Optional[Union[PdfPages, PathLike]])->None
         super().__init__(output=output)
-        matplotlib.style.use("seaborn-whitegrid")
+        _apply_style()
 
     def __del__(self):
         """Close the pdf as a destructor."""
         super().__del__()
 
-    def draw_data(self, ax, table, **kwargs):
-        # type: (Axes, Table, Any)->None
+    @staticmethod
+    def _table_arrays(table):
+        # type: (Table)->Tuple[Any, Any, Any, Any, Any, Any]
+        """Return the table columns as arrays in one pass over the frame.
+
+        The tuple is ``(x, value, unc-, unc+, rel-, rel+)``, where the last
+        two are the uncertainties relative to the central value; computing
+        them here lets a figure convert each column exactly once.
+        """
+        x = table.index.to_numpy()
+        y = table["value"].to_numpy()
+        em = table["unc-"].to_numpy()
+        ep = table["unc+"].to_numpy()
+        return x, y, em, ep, -em / y, ep / y
+
+    def draw_data(self, ax, table, arrays=None, **kwargs):
+        # type: (Axes, Table, Any, Any)->None
         """Draw the original data with uncertainty."""
-        x = table.index
-        y = table["value"]
-        ey = (table["unc-"], table["unc+"])
-        assert len(x.names) == 1
-        assert len(x) == len(y) == len(ey[0]) == len(ey[1])
+        assert len(table.index.names) == 1
+        x, y, em, ep, _, _ = arrays if arrays is not None else self._table_arrays(table)
+        # one (2, N) array; errorbar otherwise converts the rows one by one
+        ey = numpy.vstack([em, ep])
+        assert len(x) == len(y) == ey.shape[1]
         k = {"fmt": "none", "elinewidth": 1, "ecolor": "black", "label": "data"}
         k.update(kwargs)
         ax.errorbar(x, y, ey, **k)
@@ -89,16 +127,24 @@ class OneDimValidator(BaseValidator):
                 try:
                     y_list.append(obj(x))
                 except ValueError:
-                    y_list.append(None)
+                    y_list.append(numpy.nan)  # out of the interpolation range
         else:
             x_list, y_list = zip(*obj)
-        return numpy.array(x_list), numpy.array(y_list)
+        return numpy.asarray(x_list), numpy.asarray(y_list)
 
-    def draw_variations(self, ax, table, interp_list, **kwargs):
-        # type: (Axes, Table, List[Tuple[str, InterpType]], Any)->Tuple[float, float]
-        """Plot variation among interpolators and returns the worst values."""
+    def draw_variations(self, ax, table, interp_list, x_list=None, y_cache=None, **kwargs):
+        # type: (Axes, Table, List[Tuple[str, InterpType]], Any, Any, Any)->Tuple[float, float]
+        """Plot variation among interpolators and returns the worst values.
+
+        `!y_cache` may map ``id(interpolation)`` to the values already
+        sampled on `!x_list` (by `_build_x_y` for the upper panel), so that
+        the curves are not evaluated a second time here.
+        """
         label0, i0 = interp_list[0]
-        ux0, uy0 = self._build_x_y(table, i0)
+        if y_cache is not None and id(i0) in y_cache:
+            ux0, uy0 = numpy.asarray(x_list), y_cache[id(i0)]
+        else:
+            ux0, uy0 = self._build_x_y(table, i0, x_list=x_list)
 
         n_interp = len(interp_list)
 
@@ -109,29 +155,31 @@ class OneDimValidator(BaseValidator):
                 interpolation = i
             else:
                 interpolation = i.interpolate(table)
-            ux = []  # type: List[float]
-            uy = []  # type: List[float]
-            ey = []  # type: List[float]
-            v = []  # type: List[float]
-            b = []  # type: List[float]
-            for x, y0 in zip(ux0, uy0):
+            # the evaluation API is scalar, so the points are collected in one
+            # pass; the variation and badness arithmetic is then array work.
+            cached = y_cache.get(id(interpolation)) if y_cache is not None else None
+            uy = numpy.full_like(uy0, numpy.nan)
+            ey = numpy.full_like(uy0, numpy.nan)
+            for index, x in enumerate(ux0):
                 try:
-                    y = interpolation(x)
+                    y = cached[index] if cached is not None else interpolation(x)
+                    if numpy.isnan(y):  # nan marks out-of-range in the cache
+                        continue
                     e = max(abs(interpolation.unc_m_at(x)), interpolation.unc_p_at(x))
                 except ValueError:
                     continue
-                ux.append(x)
-                uy.append(y)
-                ey.append(e)
-                v.append((y - y0) / y0)
-                b.append(abs(y - y0) / e)
+                uy[index], ey[index] = y, e
+            valid = ~(numpy.isnan(uy) | numpy.isnan(uy0))
+            ux, y, y0, e = ux0[valid], uy[valid], uy0[valid], ey[valid]
+            v = (y - y0) / y0
+            b = numpy.abs(y - y0) / e
 
             color = int(n / 2) if n_interp == len(self.interpolators) * 2 + 1 else n + 1
             k = {"linewidth": 0.5, "label": label, "c": cm.tab10(color)}
             k.update(kwargs)
             ax.plot(ux, v, **k)
-            variations.append(max(abs(x) for x in v))
-            badnesses.append(max(x for x in b))
+            variations.append(numpy.abs(v).max())
+            badnesses.append(b.max())
 
         return max(v for v in variations), max(b for b in badnesses)
 
@@ -146,21 +194,32 @@ class OneDimValidator(BaseValidator):
         ax1 = fig.add_axes((m[0], m[1] + (h - h1), w, h1))
         ax2 = fig.add_axes((m[0], m[1], w, h - h1), sharex=ax1)
 
+        # interpolate once per interpolator; the fits are shared by the first
+        # plot, draw_variations, and the NLL-fast comparison below.
         interp_list = [
-            ("{}/{}".format(i.kind, i.axes), cast(AbstractInterpolator, i))
+            ("{}/{}".format(i.kind, i.axes), cast(InterpType, i.interpolate(table)))
             for i in self.interpolators
         ]  # type: List[Tuple[str, InterpType]]
 
+        # the sample grid, shared by all the interpolators and both panels
+        ux = self.split_interval(table.index, n=9, log=False)
+        arrays = self._table_arrays(table)
+
         # first plot
-        self.draw_data(ax1, table)
+        self.draw_data(ax1, table, arrays=arrays)
+        y_cache = {}  # curve samples on ux, reused by draw_variations
         for label, i in interp_list:
-            ax1.plot(*(self._build_x_y(table, i)), linewidth=0.5, label=label)
+            xi, yi = self._build_x_y(table, i, ux)
+            y_cache[id(i)] = yi
+            ax1.plot(xi, yi, linewidth=0.5, label=label)
 
         # second plot
-        ep, em = table["unc+"] / table["value"], -table["unc-"] / table["value"]
-        ax2.plot(table.index, ep, color="black", label="relative uncertainty of data")
-        ax2.plot(table.index, em, color="black")
-        v, b = self.draw_variations(ax2, table, interp_list, label="")
+        x, rel_m, rel_p = arrays[0], arrays[4], arrays[5]
+        ax2.plot(x, rel_p, color="black", label="relative uncertainty of data")
+        ax2.plot(x, rel_m, color="black")
+        v, b = self.draw_variations(
+            ax2, table, interp_list, x_list=ux, y_cache=y_cache, label=""
+        )
 
         # NLL-fast cache
         if nllfast_cache_key:
@@ -174,8 +233,11 @@ class OneDimValidator(BaseValidator):
                     ip_base = interp_list[0][1].interpolate(table)
                 else:
                     ip_base = interp_list[0][1]
-                for k, row in df.iterrows():
-                    df.loc[k, "variation"] = row["orig"] / ip_base(row["m"]) - 1
+                m_arr = df["m"].to_numpy()
+                base = numpy.fromiter(
+                    (ip_base(m) for m in m_arr), dtype=float, count=len(m_arr)
+                )
+                df["variation"] = df["orig"].to_numpy() / base - 1
                 style = {"linestyle": " ", "markeredgewidth": 0, "style": "ko"}
                 df.plot("m", "orig", ax=ax1, markersize=0.25, label="", **style)
                 df.plot("m", "variation", ax=ax2, markersize=0.25, label="", **style)
@@ -210,21 +272,34 @@ class OneDimValidator(BaseValidator):
         interp_for_variation = []  # type: List[Tuple[str, InterpType]]
         interp_for_variation.append(interp_list[0])
 
+        # the sample grid, shared by all the interpolations and both panels
+        ux = self.split_interval(table.index, n=9, log=False)
+        arrays = self._table_arrays(table)
+
         # first plot
-        self.draw_data(ax1, table)
+        self.draw_data(ax1, table, arrays=arrays)
+        y_cache = {}  # curve samples on ux, reused by draw_variations
         for index, (label, interp) in enumerate(interp_list):
             ips = SievedInterpolations(table, interp).interpolations
             c = cm.tab10(index)
+            segments = []  # one artist per interpolator, not per sieved curve
             for ip in ips.values():
                 interp_for_variation.append(("no name", ip))
-                ax1.plot(*(self._build_x_y(table, ip)), label=label, linewidth=0.5, c=c)
-                label = ""  # to remove label for the second and later lines
+                xi, yi = self._build_x_y(table, ip, ux)
+                y_cache[id(ip)] = yi
+                segments.append(numpy.column_stack([xi, yi]))
+            ax1.add_collection(
+                LineCollection(segments, colors=[c], linewidths=0.5, label=label)
+            )
+        ax1.autoscale_view()
 
         # second plot
-        ep, em = table["unc+"] / table["value"], -table["unc-"] / table["value"]
-        ax2.plot(table.index, ep, color="black", label="relative uncertainty of data")
-        ax2.plot(table.index, em, color="black")
-        v, b = self.draw_variations(ax2, table, interp_for_variation, label="")
+        x, rel_m, rel_p = arrays[0], arrays[4], arrays[5]
+        ax2.plot(x, rel_p, color="black", label="relative uncertainty of data")
+        ax2.plot(x, rel_m, color="black")
+        v, b = self.draw_variations(
+            ax2, table, interp_for_variation, x_list=ux, y_cache=y_cache, label=""
+        )
         ax2.plot([], [], " ", label=f"Variation={v:.2%}; Badness={b:.3}")
 
         self.set_labels(ax1, table, x=False, title="{file_name}")
@@ -240,16 +315,19 @@ class OneDimValidator(BaseValidator):
 class TwoDimValidator(BaseValidator):
     """Validation with sieved table interpolations."""
 
+    interpolators = {
+        "{}/loglog".format(k): ScipyGridInterpolator(
+            k, axes_wrapper=AxesWrapper(["log", "log"], "log")
+        )
+        for k in ["linear", "spline33"]
+    }  # type: Mapping[str, ScipyGridInterpolator]
+    """The interpolators to test; stateless, so shared among instances."""
+
     def __init__(self, output=None):
         # type: (Optional[Union[PdfPages, PathLike]])->None
         super().__init__(output=output)
-        loglog_wrapper = AxesWrapper(["log", "log"], "log")
-        self.interpolators = {
-            "{}/loglog".format(k): ScipyGridInterpolator(k, axes_wrapper=loglog_wrapper)
-            for k in ["linear", "spline33"]
-        }  # type: Mapping[str, ScipyGridInterpolator]
         magma = matplotlib.pyplot.get_cmap("magma_r")
-        cmap_array = [magma(i) for i in range(0, 24 * 12, 24)]
+        cmap_array = magma(numpy.arange(0, 24 * 12, 24))  # (12, 4) RGBA in one call
         self.cmap = matplotlib.colors.ListedColormap(cmap_array[1:-1])
         self.cmap.set_under(cmap_array[0])
         self.cmap.set_over(cmap_array[-1])
@@ -260,29 +338,30 @@ class TwoDimValidator(BaseValidator):
 
     def draw_interpolation(self, ax, table, data):
         # type: (Axes, Table, DataFrame)->None
-        def f(x):
-            # type: (float)->float
-            return numpy.log10(x)
-
         ax.view_init(30, 40)
 
-        xs, ys = zip(*table.index.values)
+        # columnar level access; index.values would box every row into a tuple
+        xs = table.index.get_level_values(0).to_numpy()
+        ys = table.index.get_level_values(1).to_numpy()
         zs, zps, zms = (table[k].to_numpy() for k in ("value", "unc+", "unc-"))
-        with_label = True
-        for x, y, z, zp, zm in zip(xs, ys, zs, zps, zms):
-            ax.plot(
-                [x, x],
-                [y, y],
-                [f(z + zp), f(z - zm)],
-                marker="",
-                c="black",
-                linewidth=0.3,
-                label="Data" if with_label else None,
-            )
-            with_label = False
+        # one collection instead of one Line2D artist per data point; the
+        # band edges share a single log10 launch over the stacked pair
+        z_band = numpy.log10(numpy.stack([zs + zps, zs - zms], axis=1))
+        segments = numpy.stack(
+            [
+                numpy.stack([xs, xs], axis=1),
+                numpy.stack([ys, ys], axis=1),
+                z_band,
+            ],
+            axis=2,
+        )
+        ax.add_collection3d(
+            Line3DCollection(segments, colors="black", linewidths=0.3, label="Data")
+        )
 
-        xs, ys = zip(*data.index.values)
-        ips = [f(z) for z in data["interpolation"].to_numpy()]
+        xs = data.index.get_level_values(0).to_numpy()
+        ys = data.index.get_level_values(1).to_numpy()
+        ips = numpy.log10(data["interpolation"].to_numpy())
         ax.scatter(
             xs, ys, ips, c="r", marker="_", s=10, label="interpolation", linewidth=0.5
         )
@@ -292,16 +371,23 @@ class TwoDimValidator(BaseValidator):
 
     @staticmethod
     def _extend_grid(seq):
-        # type: (Sequence[float])->List[float]
-        r = [(x1 + x2) / 2 for x1, x2 in zip(seq, seq[1:])]
-        r.insert(0, seq[0] - (seq[1] - seq[0]) / 2)
-        r.append(seq[-1] + (seq[-1] - seq[-2]) / 2)
-        return r
+        # type: (Sequence[float])->numpy.ndarray
+        s = numpy.asarray(seq, dtype=float)
+        return numpy.concatenate(
+            [
+                [s[0] - (s[1] - s[0]) / 2],
+                (s[:-1] + s[1:]) / 2,
+                [s[-1] + (s[-1] - s[-2]) / 2],
+            ]
+        )
 
     def draw_badness(self, ax, table, data):
         # type: (Axes, Table, DataFrame)->None
+        data = data.sort_index()  # guarantee lexical order for the reshape
         xs, ys = data.index.levels
-        zs = abs(data["badness"].unstack().to_numpy())
+        # the sieved grid is complete and sorted, so a plain reshape replaces
+        # the unstack round-trip through a new DataFrame.
+        zs = numpy.abs(data["badness"].to_numpy().reshape(len(xs), len(ys)))
         mesh = ax.pcolormesh(
             # note the reversed order!
             self._extend_grid(ys),
@@ -311,6 +397,7 @@ class TwoDimValidator(BaseValidator):
             vmin=0,
             vmax=1,
             linewidths=5,
+            rasterized=True,  # one raster image per page instead of a quad per cell
         )
         bar = ax.figure.colorbar(mesh)
         bar.set_label("badness", rotation=270)
@@ -322,19 +409,22 @@ class TwoDimValidator(BaseValidator):
         # type: (Table, Optional[str])->None
         """Compare multiple interpolators."""
         fig1 = matplotlib.pyplot.figure(figsize=(6.4, 9.05))
-        fig2 = matplotlib.pyplot.figure(figsize=(6.4, 9.05))
         ax1 = fig1.add_subplot(2, 1, 1, xmargin=0.3, ymargin=0.3)
-        ax2 = fig1.add_subplot(2, 1, 2, xmargin=0.3, ymargin=0.3)
-        ax3 = fig2.add_subplot(2, 1, 1)
-        ax4 = fig2.add_subplot(2, 1, 2)
 
         ip = {k: v.interpolate(table) for k, v in self.interpolators.items()}
 
         diff_df = pandas.DataFrame()
+        z_grids = {}  # type: MutableMapping[str, Any]
         # nllfast_cache_key = "13TeV.gg"
         if nllfast_cache_key:
             # plots are configured for 2 interp + orig
             assert len(self.interpolators) == 2
+            # only this branch fills four panels; the common path stays with
+            # a single axes and a single figure
+            ax2 = fig1.add_subplot(2, 1, 2, xmargin=0.3, ymargin=0.3)
+            fig2 = matplotlib.pyplot.figure(figsize=(6.4, 9.05))
+            ax3 = fig2.add_subplot(2, 1, 1)
+            ax4 = fig2.add_subplot(2, 1, 2)
             cache = nllfast_cache_dir / (nllfast_cache_key + ".cache")
             df = pandas.read_csv(
                 cache, sep="\t", header=None, names=["m1", "m2", "orig"]
@@ -343,11 +433,19 @@ class TwoDimValidator(BaseValidator):
             assert len(df.columns) == 1
             n1, n2 = ip.keys()
             ip1, ip2 = ip.values()
-            for key, _ in df.iterrows():
-                ip1_tuple = ip1.tuple_at(key)
-                df.loc[key, n1] = ip1_tuple[0]
-                df.loc[key, "unc"] = min(abs(ip1_tuple[1]), abs(ip1_tuple[2]))
-                df.loc[key, n2] = ip2(key)
+            # scalar fits evaluated point by point, but collected into arrays
+            # and written back as whole columns instead of per-cell .loc
+            v1 = numpy.empty(len(df.index))
+            unc = numpy.empty(len(df.index))
+            v2 = numpy.empty(len(df.index))
+            for i, key in enumerate(df.index):
+                value, unc_p, unc_m = ip1.tuple_at(key)
+                v1[i] = value
+                unc[i] = min(abs(unc_p), abs(unc_m))
+                v2[i] = ip2(key)
+            df[n1] = v1
+            df["unc"] = unc
+            df[n2] = v2
 
             diff_df[f"{n1} vs {n2}"] = abs(df[n1] - df[n2]) / df["unc"]
             diff_df[f"orig vs {n1}"] = abs(df["orig"] - df[n1]) / df["unc"]
@@ -364,23 +462,28 @@ class TwoDimValidator(BaseValidator):
             y_list = self.split_interval(table.index.levels[1], n=5, log=False)
             n1, n2 = ip.keys()
             ip1, ip2 = ip.values()
-            xs, ys, zs = [], [], []  # type: List[float], List[float], List[float]
-            for x in x_list:
-                for y in y_list:
-                    v1, ep, em = ip1.tuple_at(x, y)
-                    v2 = ip2(x, y)
-                    xs.append(x)
-                    ys.append(y)
-                    zs.append(abs(v1 - v2) / min(abs(ep), abs(em)))
-            diff_df = pandas.DataFrame(
-                zs, pandas.MultiIndex.from_arrays([xs, ys]), columns=[f"{n1} vs {n2}"]
-            )
+            # the index enumerates the same (x, y) pairs the nested loop did
+            index = pandas.MultiIndex.from_product([x_list, y_list])
+            zs = numpy.empty(len(index))
+            for i, (x, y) in enumerate(index):
+                v1, ep, em = ip1.tuple_at(x, y)
+                zs[i] = abs(v1 - ip2(x, y)) / min(abs(ep), abs(em))
+            diff_df = pandas.DataFrame(zs, index, columns=[f"{n1} vs {n2}"])
+            # the product grid is complete and sorted, so the 2-d array for
+            # pcolormesh is a plain reshape; no unstack round-trip needed
+            z_grids[f"{n1} vs {n2}"] = zs.reshape(len(x_list), len(y_list))
             plots_and_columns = [(ax1, f"{n1} vs {n2}")]
 
         xs, ys = [self._extend_grid(seq) for seq in diff_df.index.levels]
         for ax, k in plots_and_columns:
-            zs = abs(diff_df[k].unstack().to_numpy())
-            mesh = ax.pcolormesh(ys, xs, zs, cmap=self.cmap, vmin=0, vmax=1)
+            if k in z_grids:
+                zs = z_grids[k]
+            else:
+                # NLL-fast grids may be sparse, so keep the unstack here
+                zs = abs(diff_df[k].unstack().to_numpy())
+            mesh = ax.pcolormesh(
+                ys, xs, zs, cmap=self.cmap, vmin=0, vmax=1, rasterized=True
+            )
             # note the x/y reversed order!
             bar = ax.figure.colorbar(mesh, ax=ax)
             bar.set_label("badness", rotation=270)
@@ -392,7 +495,6 @@ class TwoDimValidator(BaseValidator):
         adj = {"left": 0.22, "bottom": 0.12, "right": 0.9, "top": 0.83, "hspace": 0.24}
 
         if len(plots_and_columns) == 1:
-            ax2.remove()
             fig1.suptitle(f"{table.file.table_path.name}", y=0.9)
             fig1.subplots_adjust(**adj)
             self._save(fig1)